@@ -7,6 +7,7 @@ from keyword_extraction import KeywordExtractor
 from part_of_speech_tagging import POSTagging
 from emotion_detection import EmotionDetection
 from named_entity_recognition import NamedEntityRecognition
+from sentiment_emotion_classification import SentimentEmotionClassification
 
 hide_streamlit_style = """
             <style>
@@ -33,6 +34,10 @@ def load_pos_model():
 def load_emotion_model():
     return EmotionDetection()
 
+@st.cache(allow_output_mutation=True)
+def load_sentiment_emotion_model():
+    return SentimentEmotionClassification(load_sentiment_model(), load_emotion_model())
+
 @st.cache(allow_output_mutation=True)
 def load_ner_model():
     return NamedEntityRecognition()
@@ -42,6 +47,7 @@ sentiment_analyzer = load_sentiment_model()
 keyword_extractor = load_keyword_model()
 pos_tagger = load_pos_model()
 emotion_detector = load_emotion_model()
+sentiment_emotion_classifier = load_sentiment_emotion_model()
 ner = load_ner_model()
 
 example_text = "This is example text that contains both names of organizations like Hugging Face and cities like New York, all while portraying an upbeat attitude."
@@ -54,12 +60,14 @@ with st.sidebar:
                                 "Keyword Extraction",
                                 "Part of Speech Tagging",
                                 "Emotion Detection",
+                                "Sentiment & Emotion",
                                 "Named Entity Recognition"],
                        icons=["house-door",
                               "chat-dots",
                               "key",
                               "tag",
                               "emoji-heart-eyes",
+                              "layers",
                               "building"],
                        default_index=0
                        )
@@ -101,6 +109,7 @@ if page == "Welcome!":
             * Keyword Extraction
             * Part of Speech Tagging
             * Emotion Detection
+            * Sentiment & Emotion
             * Named Entity Recognition
             
         More features may be added in the future including article/tweet/youtube input, improved text annotation, model quality improvements, 
@@ -230,6 +239,28 @@ elif page == "Emotion Detection":
             st.subheader("Emotion Justification")
             st.components.v1.html(raw_html, height=500)
 
+elif page == "Sentiment & Emotion":
+    st.header('Sentiment & Emotion')
+    st.write(
+        """
+
+
+        """
+    )
+
+    text = st.text_area("Paste text here", value=example_text)
+
+    if st.button('🔥 Run!'):
+        with st.spinner("Loading..."):
+            sentiment_preds, emotion_preds = sentiment_emotion_classifier.classify(text)
+            st.success('All done!')
+            st.write("")
+            st.subheader("Sentiment Predictions")
+            st.bar_chart(data=sentiment_preds.iloc[0], width=0, height=0, use_container_width=True)
+            st.write("")
+            st.subheader("Emotion Predictions")
+            st.bar_chart(data=emotion_preds.iloc[0], width=0, height=0, use_container_width=True)
+
 elif page == "Named Entity Recognition":
     st.header('Named Entity Recognition')
     st.markdown("![Alt Text](https://media.giphy.com/media/lxO8wdWdu4tig/giphy.gif)")
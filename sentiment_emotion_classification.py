@@ -0,0 +1,69 @@
+import torch
+import pandas as pd
+
+
+class SentimentEmotionClassification:
+    """
+    Combined Sentiment and Emotion classification on text data.
+
+    Both models are fine-tuned from twitter-roberta-base and share the same
+    tokenizer, so each text is tokenized once and the same tensors are fed
+    to both models in a single batch.
+
+    Attributes:
+        tokenizer: An instance of Hugging Face Tokenizer shared by both models
+        sentiment_model: An instance of Hugging Face Model for sentiment
+        emotion_model: An instance of Hugging Face Model for emotion
+        max_length: Maximum number of tokens per text fed to the models
+    """
+
+    def __init__(self, sentiment_analyzer, emotion_detector):
+        # Input ids are only valid for both models if the vocabularies match
+        if sentiment_analyzer.tokenizer.get_vocab() != emotion_detector.tokenizer.get_vocab():
+            raise ValueError("Sentiment and emotion models must share the same tokenizer vocabulary")
+
+        # Reuse already loaded models instead of loading the weights a second time
+        self.tokenizer = sentiment_analyzer.tokenizer
+        self.sentiment_model = sentiment_analyzer.model
+        self.emotion_model = emotion_detector.model
+
+        # RoBERTa reserves two position embeddings for the padding offset
+        self.max_length = min(self.sentiment_model.config.max_position_embeddings,
+                              self.emotion_model.config.max_position_embeddings) - 2
+
+    def classify(self, texts):
+        """
+        Recognize Sentiment and Emotion in one or more texts.
+
+        A single string is treated as a batch of one, so results always have
+        one row per input text on a positional index; use .iloc[0] for a single text.
+
+        Parameters:
+            texts (str or list): The user input string(s) to perform classification on
+
+        Returns:
+            sentiment_preds (DataFrame): The predicted probabilities for sentiment classes
+            emotion_preds (DataFrame): The predicted probabilities for emotion classes
+        """
+
+        if isinstance(texts, str):
+            texts = [texts]
+
+        sentiment_labels = list(self.sentiment_model.config.id2label.values())
+        emotion_labels = list(self.emotion_model.config.id2label.values())
+
+        if not texts:
+            return pd.DataFrame(columns=sentiment_labels), pd.DataFrame(columns=emotion_labels)
+
+        tokens = self.tokenizer(texts, add_special_tokens=False, padding=True, truncation=True,
+                                max_length=self.max_length, return_tensors='pt')
+        with torch.no_grad():
+            sentiment_logits = self.sentiment_model(**tokens)[0]
+            emotion_logits = self.emotion_model(**tokens)[0]
+
+        sentiment_probs = torch.nn.functional.softmax(sentiment_logits, dim=-1).numpy()
+        emotion_probs = torch.nn.functional.softmax(emotion_logits, dim=-1).numpy()
+        sentiment_preds = pd.DataFrame(sentiment_probs, columns=sentiment_labels)
+        emotion_preds = pd.DataFrame(emotion_probs, columns=emotion_labels)
+
+        return sentiment_preds, emotion_preds